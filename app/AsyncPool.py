@@ -1,10 +1,11 @@
 import asyncio
-from datetime import datetime, timezone
+import collections
 import logging
+import time
 
 
-class Terminator:
-    pass
+_TERMINATOR = object()
+"Sentinel pushed once per worker on join() to unblock and stop the worker loops."
 
 
 class AsyncPool:
@@ -38,7 +39,12 @@ class AsyncPool:
         self._loop = loop if loop else asyncio.get_event_loop()
         self._num_workers = num_workers
         self._logger = logger if logger else logging.getLogger(__name__)
-        self._queue = asyncio.Queue(num_workers * load_factor)
+        # A plain deque with a semaphore for back-pressure and an event for empty-signaling
+        # is materially cheaper per op than asyncio.Queue, which allocates waiter Futures
+        # inside every contended put/get.
+        self._deque: collections.deque = collections.deque()
+        self._sem = asyncio.Semaphore(num_workers * load_factor)
+        self._not_empty = asyncio.Event()
         self._workers: dict[str, asyncio.Future] = {}
         self._exceptions = False
         self._max_task_time = max_task_time
@@ -48,27 +54,82 @@ class AsyncPool:
         self._worker_co = worker_co
         self._status: dict[str, dict | None] = {}
 
-    async def _worker_loop(self, worker_id: str):
+    async def _get(self):
+        """ Wait for and pop the next queued item. """
+        while not self._deque:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        return self._deque.popleft()
+
+    async def _worker_loop_nofut(self, worker_id: str):
+        """ Lean worker loop used when `return_futures` is False. Items are `(args, kwargs)` pairs. """
         while True:
             got_obj = False
-            future = None
             try:
-                item = await self._queue.get()
+                item = await self._get()
+
+                if item is _TERMINATOR:
+                    break
+
                 got_obj = True
+                args, kwargs = item
+
+                self._status[worker_id] = {
+                    'started': time.time(),
+                    'data': kwargs.get('entry', {'info': {}}).info.__dict__,
+                }
+
+                if self._max_task_time is None:
+                    await self._worker_co(*args, **kwargs)
+                else:
+                    async with asyncio.timeout(self._max_task_time):
+                        await self._worker_co(*args, **kwargs)
+            except (KeyboardInterrupt, MemoryError, SystemExit):
+                self._exceptions = True
+                raise
+            except BaseException as e:
+                if isinstance(e, asyncio.exceptions.CancelledError):
+                    raise e
+
+                self._exceptions = True
+                self._logger.exception(f'Worker call failed. {str(e)}')
+            finally:
+                # only touch the bookkeeping when a real item was dequeued, so an
+                # exit or cancellation mid-get cannot skew worker availability.
+                if got_obj:
+                    self._status[worker_id] = None
+                    self._sem.release()
+
+        # the worker stopped, it should no longer count as available.
+        self._status.pop(worker_id, None)
+
+    async def _worker_loop_fut(self, worker_id: str):
+        """ Worker loop used when `return_futures` is True. Items are `(future, args, kwargs)` triples. """
+        while True:
+            got_obj = False
+            future = None
+            try:
+                item = await self._get()
 
-                if item.__class__ is Terminator:
+                if item is _TERMINATOR:
                     break
 
+                got_obj = True
                 future, args, kwargs = item
 
                 self._status[worker_id] = {
-                    'started': self._time().isoformat(),
+                    'started': time.time(),
                     'data': kwargs.get('entry', {'info': {}}).info.__dict__,
                 }
 
-                # the wait_for will cancel the task (task sees CancelledError) and raises a TimeoutError from here
-                # so be wary of catching TimeoutErrors in this loop
-                result = await asyncio.wait_for(self._worker_co(*args, **kwargs), timeout=self._max_task_time)
+                if self._max_task_time is None:
+                    result = await self._worker_co(*args, **kwargs)
+                else:
+                    # the timeout context cancels the task (task sees CancelledError) and raises a TimeoutError
+                    # on exit, so be wary of catching TimeoutErrors in this loop
+                    async with asyncio.timeout(self._max_task_time):
+                        result = await self._worker_co(*args, **kwargs)
 
                 if future:
                     future.set_result(result)
@@ -89,10 +150,11 @@ class AsyncPool:
                 else:
                     self._logger.exception(f'Worker call failed. {str(e)}')
             finally:
-                self._status[worker_id] = None
-
                 if got_obj:
-                    self._queue.task_done()
+                    self._status[worker_id] = None
+                    self._sem.release()
+
+        self._status.pop(worker_id, None)
 
     @property
     def exceptions(self):
@@ -110,7 +172,7 @@ class AsyncPool:
         """
         return sum(1 for worker_status in self._status.values() if worker_status is None)
 
-    def get_workers_status(self) -> dict[str, datetime | None]:
+    def get_workers_status(self) -> dict[str, dict | None]:
         """
         :return: dictionary of worker status.
         """
@@ -132,17 +194,62 @@ class AsyncPool:
 
         :return: future of result.
         """
-        future = asyncio.futures.Future(loop=self._loop) if self._return_futures else None
-        await self._queue.put((future, args, kwargs))
+        if self._return_futures:
+            future = asyncio.futures.Future(loop=self._loop)
+            item = (future, args, kwargs)
+        else:
+            future = None
+            item = (args, kwargs)
+
+        await self._sem.acquire()
+        self._deque.append(item)
+        self._not_empty.set()
 
         self._logger.debug(f"'{self._name}' pool has received a new job. {args} {kwargs}")
 
         return future
 
+    async def push_many(self, items) -> list[asyncio.Future]:
+        """
+        Bulk variant of `push`. Items are appended without yielding to the loop
+        while the pool has capacity; the back-pressure semaphore only suspends
+        when the backlog limit is hit. This avoids one event-loop checkpoint per
+        item on bulk submits.
+
+        :param items: iterable of `(args, kwargs)` pairs to be passed to `worker_co`.
+
+        :return: list of futures, one per item, empty unless `return_futures` is set.
+        """
+        futures: list[asyncio.Future] = []
+        count = 0
+
+        for args, kwargs in items:
+            if self._return_futures:
+                future = asyncio.futures.Future(loop=self._loop)
+                futures.append(future)
+                item = (future, args, kwargs)
+            else:
+                item = (args, kwargs)
+
+            await self._sem.acquire()
+            self._deque.append(item)
+            self._not_empty.set()
+
+            count += 1
+
+        self._logger.debug(f"'{self._name}' pool has received '{count}' new jobs.")
+
+        return futures
+
     def start(self):
         """ Will start up worker pool and reset exception state """
         self._exceptions = False
 
+        # Python >= 3.12. Run each task eagerly up to its first suspension point,
+        # which skips a schedule/step cycle when the queue already has items.
+        if hasattr(asyncio, 'eager_task_factory'):
+            self._loop.set_task_factory(asyncio.eager_task_factory)
+
         for worker_number in range(self._num_workers):
             worker_id = f"worker_{worker_number+1}"
             self._createWorker(worker_id)
@@ -194,13 +301,21 @@ class AsyncPool:
 
         self._logger.info(f'Joining {self._name}')
 
-        # The Terminators will kick each worker from being blocked against the _queue.get() and allow
-        # each one to exit.
+        # The sentinels will kick each worker from being blocked against _get() and allow
+        # each one to exit. They bypass the back-pressure semaphore on purpose, so a
+        # full backlog cannot stall the shutdown.
         for _ in range(self._num_workers):
-            await self._queue.put(Terminator())
+            self._deque.append(_TERMINATOR)
+
+        self._not_empty.set()
 
         try:
-            await asyncio.gather(*list(self._workers))
+            # awaiting the handful of worker tasks directly skips gather's
+            # wrapper future per child. This also fixes joining against the
+            # dict keys instead of the worker futures.
+            for worker in self._workers.values():
+                await worker
+
             self._workers = {}
         except:
             self._logger.exception(f'Exception joining {self._name}')
@@ -216,15 +331,14 @@ class AsyncPool:
             self._logger.debug(f'Worker {worker_id} already exists.')
             return self._workers[worker_id]
 
+        worker_loop = self._worker_loop_fut if self._return_futures else self._worker_loop_nofut
+
         self._status[worker_id] = None
         self._workers[worker_id] = asyncio.ensure_future(
-            coro_or_future=self._worker_loop(worker_id=worker_id),
+            coro_or_future=worker_loop(worker_id=worker_id),
             loop=self._loop
         )
 
         self._logger.debug(f'Created {worker_id}')
 
         return self._workers[worker_id]
-
-    def _time(self) -> datetime:
-        return datetime.now(tz=timezone.utc)
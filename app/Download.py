@@ -1,17 +1,19 @@
 import asyncio
-import json
 import logging
 import multiprocessing
 import os
-import re
 import shutil
 import yt_dlp
 import hashlib
-from AsyncPool import Terminator
 from Utils import Notifier, get_format, get_opts, jsonCookie, mergeConfig
 from ItemDTO import ItemDTO
 from Config import Config
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
 LOG = logging.getLogger('download')
 
 
@@ -20,7 +22,6 @@ class Download:
     Download task.
     """
     id: str = None
-    manager = None
     download_dir: str = None
     temp_dir: str = None
     output_template: str = None
@@ -32,12 +33,10 @@ class Download:
     debug: bool = False
     tempPath: str = None
     notifier: Notifier = None
-    manager: multiprocessing.Manager = None
     canceled: bool = False
     is_live: bool = False
     info_dict: dict = None
     "yt-dlp metadata dict."
-    update_task = None
 
     bad_live_options: list = [
         "concurrent_fragment_downloads",
@@ -46,7 +45,7 @@ class Download:
     ]
     "Bad yt-dlp options which are known to cause issues with live stream and post manifestless mode."
 
-    _ytdlp_fields: tuple = (
+    _ytdlp_fields: frozenset = frozenset((
         'tmpfilename',
         'filename',
         'status',
@@ -56,7 +55,7 @@ class Download:
         'downloaded_bytes',
         'speed',
         'eta',
-    )
+    ))
     "Fields to be extracted from yt-dlp progress hook."
 
     tempKeep: bool = False
@@ -78,6 +77,8 @@ class Download:
         self.canceled = False
         self.tmpfilename = None
         self.status_queue = None
+        self._status_reader = None
+        self._loop = None
         self.proc = None
         self.notifier = None
         self.max_workers = int(config.max_workers)
@@ -86,9 +87,34 @@ class Download:
         self.is_manifestless = 'is_manifestless' in self.info.options and self.info.options['is_manifestless'] is True
         self.info_dict = info_dict
 
+        # Derive the per-download temp directory once, it is deterministic per item.
+        self.tempPath = os.path.join(
+            self.temp_dir,
+            hashlib.shake_256(f"D-{self.info.id}".encode('utf-8')).hexdigest(5)
+        )
+
+        # The merged yt-dlp params are deterministic per item, build them once here
+        # instead of repeating the merge inside the child process on every start.
+        self._base_params: dict = {
+            'color': 'no_color',
+            'format': self.format,
+            'paths': {
+                'home': self.download_dir,
+                'temp': self.tempPath,
+            },
+            'outtmpl': {
+                'default': self.output_template,
+                'chapter': self.output_template_chapter
+            },
+            'noprogress': True,
+            'break_on_existing': True,
+            'ignoreerrors': False,
+            **mergeConfig(self.default_ytdl_opts, self.ytdl_opts),
+        }
+
     def _progress_hook(self, data: dict):
-        dataDict = {k: v for k, v in data.items() if k in self._ytdlp_fields}
-        self.status_queue.put({'id': self.id, **dataDict})
+        dataDict = {k: data[k] for k in self._ytdlp_fields if k in data}
+        self.status_queue.send({'id': self.id, **dataDict})
 
     def _postprocessor_hook(self, data: dict):
         if data.get('postprocessor') != 'MoveFiles' or data.get('status') != 'finished':
@@ -99,7 +125,7 @@ class Download:
         else:
             filename = data['info_dict']['filepath']
 
-        self.status_queue.put({
+        self.status_queue.send({
             'id': self.id,
             'status': 'finished',
             'filename': filename
@@ -108,22 +134,9 @@ class Download:
     def _download(self):
         try:
             params: dict = {
-                'color': 'no_color',
-                'format': self.format,
-                'paths': {
-                    'home': self.download_dir,
-                    'temp': self.tempPath,
-                },
-                'outtmpl': {
-                    'default': self.output_template,
-                    'chapter': self.output_template_chapter
-                },
-                'noprogress': True,
-                'break_on_existing': True,
-                'ignoreerrors': False,
+                **self._base_params,
                 'progress_hooks': [self._progress_hook],
                 'postprocessor_hooks': [self._postprocessor_hook],
-                **mergeConfig(self.default_ytdl_opts, self.ytdl_opts),
             }
 
             params['ignoreerrors'] = False
@@ -171,9 +184,9 @@ class Download:
                 LOG.debug(f'Downloading using url: {self.info.url}')
                 ret = cls.download([self.info.url])
 
-            self.status_queue.put({'id': self.id, 'status': 'finished' if ret == 0 else 'error'})
+            self.status_queue.send({'id': self.id, 'status': 'finished' if ret == 0 else 'error'})
         except Exception as exc:
-            self.status_queue.put({
+            self.status_queue.send({
                 'id': self.id,
                 'status': 'error',
                 'msg': str(exc),
@@ -183,15 +196,12 @@ class Download:
         LOG.info(f'Finished {os.getpid()=} id="{self.info.id}" title="{self.info.title}".')
 
     async def start(self, notifier: Notifier):
-        self.manager = multiprocessing.Manager()
         self.notifier = notifier
-        self.status_queue = self.manager.Queue()
+        self._loop = asyncio.get_running_loop()
 
-        # Create temp dir for each download.
-        self.tempPath = os.path.join(
-            self.temp_dir,
-            hashlib.shake_256(f"D-{self.info.id}".encode('utf-8')).hexdigest(5)
-        )
+        # The child writes status dicts to the pipe, the parent consumes them via an
+        # event-loop reader callback. No thread pool hop per progress event.
+        self._status_reader, self.status_queue = multiprocessing.Pipe(duplex=False)
 
         if not os.path.exists(self.tempPath):
             os.makedirs(self.tempPath, exist_ok=True)
@@ -200,10 +210,14 @@ class Download:
         self.proc.start()
         self.info.status = 'preparing'
 
+        # Close our copy of the write end, the child holds its own. The reader then
+        # sees EOF when the child exits instead of blocking forever.
+        self.status_queue.close()
+        self._loop.add_reader(self._status_reader.fileno(), self._read_status)
+
         asyncio.create_task(self.notifier.updated(self.info), name=f"notifier-{self.id}")
-        asyncio.create_task(self.progress_update(), name=f"update-{self.id}")
 
-        return await asyncio.get_running_loop().run_in_executor(None, self.proc.join)
+        return await self._loop.run_in_executor(None, self.proc.join)
 
     def started(self) -> bool:
         return self.proc is not None
@@ -228,25 +242,17 @@ class Download:
         try:
             LOG.info(f"Closing download process: '{procId}'.")
             try:
-                if 'update_task' in self.__dict__ and self.update_task.done() is False:
-                    self.update_task.cancel()
+                # drain whatever the child managed to send before tearing the reader down.
+                self._read_status()
+                self._close_status_reader()
             except Exception as e:
-                LOG.error(f"Failed to close status queue: '{procId}'. {e}")
+                LOG.error(f"Failed to close status reader: '{procId}'. {e}")
                 pass
 
             self.kill()
 
-            loop = asyncio.get_running_loop()
-            tasks = []
-
             if self.proc.is_alive():
-                tasks.append(loop.run_in_executor(None, self.proc.join))
-
-            if self.manager:
-                tasks.append(loop.run_in_executor(None, self.manager.shutdown))
-
-            if len(tasks) > 0:
-                await asyncio.gather(*tasks)
+                await asyncio.get_running_loop().run_in_executor(None, self.proc.join)
 
             if self.proc:
                 self.proc.close()
@@ -293,7 +299,9 @@ class Download:
                 f'Keeping live temp directory [{self.tempPath}], as the reported status is not finished [{self.info.status}].')
             return
 
-        if not os.path.exists(self.tempPath):
+        try:
+            os.stat(self.tempPath)
+        except FileNotFoundError:
             return
 
         if self.tempPath == self.temp_dir:
@@ -304,67 +312,110 @@ class Download:
         LOG.info(f'Deleting Temp directory: {self.tempPath}')
         shutil.rmtree(self.tempPath, ignore_errors=True)
 
-    async def progress_update(self):
+    @staticmethod
+    def _is_plain_progress(status: dict) -> bool:
+        """ True for progress ticks that carry no filename and no terminal status. """
+        return 'filename' not in status and status.get('status') not in ('finished', 'error')
+
+    def _read_status(self):
         """
-        Update status of download task and notify the client.
+        Event loop reader callback, invoked when the status pipe becomes readable.
+        Drains all pending messages per wakeup and coalesces consecutive plain
+        progress ticks into the latest one, so yt-dlp emitting many ticks per
+        second results in one client notification per drain instead of one each.
         """
-        while True:
-            try:
-                self.update_task = asyncio.get_running_loop().run_in_executor(None, self.status_queue.get)
-            except asyncio.CancelledError:
-                LOG.debug(f'Closing progress update for: {self.info._id=}.')
-                return
+        statuses: list[dict] = []
 
-            status = await self.update_task
+        try:
+            while self._status_reader is not None and self._status_reader.poll():
+                status = self._status_reader.recv()
+
+                if status is None:
+                    self._close_status_reader()
+                    break
+
+                if statuses and self._is_plain_progress(status) and self._is_plain_progress(statuses[-1]):
+                    statuses[-1] = status
+                else:
+                    statuses.append(status)
+        except (EOFError, OSError):
+            # The child exited and closed its end of the pipe.
+            self._close_status_reader()
+
+        updated = False
+        for status in statuses:
+            updated = self.progress_update(status) or updated
+
+        if updated:
+            asyncio.create_task(self.notifier.updated(self.info), name=f"notifier-u-{self.id}")
 
-            if status is None or status.__class__ is Terminator:
-                LOG.debug(f'Closing progress update for: {self.info._id=}.')
-                return
+    def _close_status_reader(self):
+        if self._status_reader is None:
+            return
 
-            if status.get('id') != self.id or len(status) < 2:
-                continue
+        try:
+            self._loop.remove_reader(self._status_reader.fileno())
+        except (OSError, ValueError):
+            pass
 
-            if self.debug:
-                LOG.debug(f'Status Update: {self.info._id=} {status=}')
+        try:
+            self._status_reader.close()
+        except OSError:
+            pass
+
+        self._status_reader = None
+        LOG.debug(f'Closed progress update reader for: {self.info._id=}.')
+
+    def progress_update(self, status: dict) -> bool:
+        """
+        Update status of download task.
 
-            if isinstance(status, str):
-                asyncio.create_task(self.notifier.updated(self.info), name=f"notifier-u-{self.id}")
-                continue
+        :return: True when the status was applied and the client should be notified.
+        """
+        if status.get('id') != self.id or len(status) < 2:
+            return False
 
-            self.tmpfilename = status.get('tmpfilename')
+        if self.debug:
+            LOG.debug(f'Status Update: {self.info._id=} {status=}')
 
-            if 'filename' in status:
-                self.info.filename = os.path.relpath(status.get('filename'), self.download_dir)
+        self.tmpfilename = status.get('tmpfilename')
 
-                if os.path.exists(status.get('filename')):
-                    self.info.file_size = os.path.getsize(status.get('filename'))
+        fileStat = None
 
-                # Set correct file extension for thumbnails
-                if self.info.format == 'thumbnail':
-                    self.info.filename = re.sub(r'\.webm$', '.jpg', self.info.filename)
+        if 'filename' in status:
+            filename: str = status.get('filename')
+            self.info.filename = os.path.relpath(filename, self.download_dir)
 
-            self.info.status = status.get('status', self.info.status)
-            self.info.msg = status.get('msg')
+            # single stat call covers both the existence check and the size.
+            try:
+                fileStat = os.stat(filename)
+                self.info.file_size = fileStat.st_size
+            except OSError:
+                pass
 
-            if self.info.status == 'error' and 'error' in status:
-                self.info.error = status.get('error')
-                asyncio.create_task(self.notifier.error(self.info, self.info.error), name=f"notifier-e-{self.id}")
+            # Set correct file extension for thumbnails
+            if self.info.format == 'thumbnail' and self.info.filename.endswith('.webm'):
+                self.info.filename = self.info.filename[:-5] + '.jpg'
 
-            if 'downloaded_bytes' in status:
-                total = status.get('total_bytes') or status.get('total_bytes_estimate')
-                if total:
-                    self.info.percent = status['downloaded_bytes'] / total * 100
-                    self.info.total_bytes = total
+        self.info.status = status.get('status', self.info.status)
+        self.info.msg = status.get('msg')
 
-            self.info.speed = status.get('speed')
-            self.info.eta = status.get('eta')
+        if self.info.status == 'error' and 'error' in status:
+            self.info.error = status.get('error')
+            asyncio.create_task(self.notifier.error(self.info, self.info.error), name=f"notifier-e-{self.id}")
 
-            if self.info.status == 'finished' and 'filename' in status and self.info.format != 'thumbnail':
-                try:
-                    self.info.file_size = os.path.getsize(status.get('filename'))
-                except FileNotFoundError:
-                    LOG.warning(f'File not found: {status.get("filename")}')
-                    self.info.file_size = None
-                    pass
+        if 'downloaded_bytes' in status:
+            total = status.get('total_bytes') or status.get('total_bytes_estimate')
+            if total:
+                self.info.percent = status['downloaded_bytes'] / total * 100
+                self.info.total_bytes = total
 
-            asyncio.create_task(self.notifier.updated(self.info), name=f"notifier-u-{self.id}")
+        self.info.speed = status.get('speed')
+        self.info.eta = status.get('eta')
+
+        if self.info.status == 'finished' and 'filename' in status and self.info.format != 'thumbnail':
+            if fileStat is None:
+                LOG.warning(f'File not found: {status.get("filename")}')
+                self.info.file_size = None
+
+        return True
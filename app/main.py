@@ -784,4 +784,12 @@ class Main:
 
 if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG)
+
+    try:
+        import uvloop
+        uvloop.install()
+        LOG.info('Using uvloop event loop policy.')
+    except ImportError:
+        LOG.debug('uvloop is not available, using default event loop policy.')
+
     main = Main()
@@ -6,8 +6,8 @@ from .ffprobe import FFProbe
 
 
 class M3u8:
-    ok_vcodecs: tuple = ('h264', 'x264', 'avc',)
-    ok_acodecs: tuple = ('aac', 'mp3',)
+    ok_vcodecs: frozenset = frozenset(('h264', 'x264', 'avc',))
+    ok_acodecs: frozenset = frozenset(('aac', 'mp3',))
 
     url: str = None
     duration: float = 6.000000
@@ -53,19 +53,34 @@ class M3u8:
             if stream.is_audio():
                 if stream.codec_name not in self.ok_acodecs:
                     segmentParams['ac'] = 1
-
-        for i in range(splits):
-            if (i + 1) == splits:
-                segmentSize = '{:.6f}'.format(duration - (i * self.duration))
-                segmentParams.update({'sd': segmentSize})
+            if 'vc' in segmentParams and 'ac' in segmentParams:
+                break
+
+        # Everything but the last segment shares the same EXTINF line and query
+        # string, so build those once instead of per iteration.
+        segmentsBase: str = f"{self.url}player/segments/"
+        fileSuffix: str = f"{quote(file)}.ts"
+        extInf: str = f"#EXTINF:{segmentSize},"
+        paramsSuffix: str = ''
+        if len(segmentParams) > 0:
+            paramsSuffix = '?'+'&'.join([f"{key}={value}" for key, value in segmentParams.items()])
+
+        for i in range(splits - 1):
+            m3u8.append(extInf)
+            m3u8.append(f"{segmentsBase}{i}/{fileSuffix}{paramsSuffix}")
+
+        # The last segment carries the leftover duration as its size. A zero
+        # duration yields no splits at all, hence the guard.
+        if splits > 0:
+            lastSegment: int = splits - 1
+            segmentSize = '{:.6f}'.format(duration - (lastSegment * self.duration))
+            segmentParams.update({'sd': segmentSize})
 
             m3u8.append(f"#EXTINF:{segmentSize},")
-
-            url = f"{self.url}player/segments/{i}/{quote(file)}.ts"
-            if len(segmentParams) > 0:
-                url += '?'+'&'.join([f"{key}={value}" for key, value in segmentParams.items()])
-
-            m3u8.append(url)
+            m3u8.append(
+                f"{segmentsBase}{lastSegment}/{fileSuffix}"
+                + '?'+'&'.join([f"{key}={value}" for key, value in segmentParams.items()])
+            )
 
         m3u8.append("#EXT-X-ENDLIST")
 